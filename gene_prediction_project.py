@@ -14,9 +14,30 @@ Tools Compared: Genscan, GlimmerHMM, SNAP, AUGUSTUS
 
 import os
 import json
-import random
-import time
+import functools
+import gzip
+import hashlib
+import itertools
+import math
+import multiprocessing
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from string import Template
+
+import numpy as np
+import orjson
+from numba import njit
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import maximum_bipartite_matching
+
+RANDOM_SEED = 42
+
+# PCG64 stream for this process; workers rebind it from SeedSequence
+# children spawned in main so parallel streams stay decorrelated
+rng = np.random.default_rng(np.random.SeedSequence(RANDOM_SEED))
 
 # ============================================================================
 # SETUP DIRECTORIES
@@ -27,83 +48,253 @@ DATA_DIR = BASE_DIR / "data"
 SEQ_DIR = DATA_DIR / "sequences"
 ANNO_DIR = DATA_DIR / "annotations"
 RESULTS_DIR = BASE_DIR / "results"
+CACHE_DIR = RESULTS_DIR / "cache"
 VIZ_DIR = BASE_DIR / "visualizations"
 
-for d in [SEQ_DIR, ANNO_DIR, RESULTS_DIR, VIZ_DIR]:
+for d in [SEQ_DIR, ANNO_DIR, RESULTS_DIR, CACHE_DIR, VIZ_DIR]:
     d.mkdir(parents=True, exist_ok=True)
 
 # ============================================================================
 # DATA GENERATION - Creates ~50 Human Genomic Regions
 # ============================================================================
 
-def generate_dna_sequence(length, gc_content=0.42):
-    """Generate realistic DNA sequence with specified GC content"""
+# 2-bit base encoding: A=0, C=1, G=2, T=3
+_BASE_CHARS = np.frombuffer(b"ACGT", dtype=np.uint8)
+
+def generate_dna_sequence(length, rng, gc_content=0.42):
+    """Generate a DNA sequence with specified GC content as 2-bit base codes"""
     gc = int(length * gc_content)
     at = length - gc
-    seq = ['G']*(gc//2) + ['C']*(gc//2) + ['A']*(at//2) + ['T']*(at//2)
-    while len(seq) < length:
-        seq.append(random.choice('ATGC'))
-    random.shuffle(seq)
-    return ''.join(seq)
-
-def generate_dataset(num_genes=50):
-    """Generate dataset of human genomic regions with varying complexity"""
-    genes = []
+    # Fill exact base counts into a preallocated code buffer, then let
+    # NumPy's C-level Fisher-Yates shuffle randomize the order -- exact
+    # GC content without a Python list of single-character strings
+    buf = np.empty(length, dtype=np.uint8)
+    pos = 0
+    for code, count in ((2, gc // 2), (1, gc // 2), (0, at // 2), (3, at // 2)):
+        buf[pos:pos + count] = code
+        pos += count
+    if pos < length:
+        buf[pos:] = rng.integers(0, 4, size=length - pos, dtype=np.uint8)
+    rng.shuffle(buf)
+    return buf
+
+def pack_sequence(codes):
+    """Pack 2-bit base codes into a uint8 array, 4 bases per byte"""
+    padded = -(-codes.shape[0] // 4) * 4
+    if padded != codes.shape[0]:
+        codes = np.concatenate([codes, np.zeros(padded - codes.shape[0], dtype=np.uint8)])
+    return (codes[0::4] << 6) | (codes[1::4] << 4) | (codes[2::4] << 2) | codes[3::4]
+
+def unpack_sequence(packed, length):
+    """Decode a packed 2-bit sequence slice back to ASCII bytes"""
+    codes = np.empty(packed.shape[0] * 4, dtype=np.uint8)
+    codes[0::4] = packed >> 6
+    codes[1::4] = (packed >> 4) & 3
+    codes[2::4] = (packed >> 2) & 3
+    codes[3::4] = packed & 3
+    return _BASE_CHARS[codes[:length]].tobytes()
+
+COMPLEXITY_LABELS = ("simple", "moderate", "complex")
+
+@dataclass
+class GeneDataset:
+    """Column-major (SoA) storage for the generated genomic regions.
+
+    Scalar fields live in NumPy arrays, exons in a ragged CSR pair
+    (offsets + coords), and all sequences in one concatenated buffer --
+    cache-friendly for batch passes, with GeneView giving per-gene access.
+    """
+    gene_ids: list
+    gene_names: list
+    chroms: list
+    strands: list
+    starts: np.ndarray       # int64[N]
+    ends: np.ndarray         # int64[N]
+    num_exons: np.ndarray    # int32[N]
+    complexity: np.ndarray   # uint8[N], index into COMPLEXITY_LABELS
+    seq_lengths: np.ndarray  # int64[N]
+    exon_offsets: np.ndarray # int64[N+1], CSR offsets into exon_coords
+    exon_coords: np.ndarray  # int64[total_exons, 2], absolute coordinates
+    exon_coords_rel: np.ndarray # int64[total_exons, 2], region-relative coords
+    seq_offsets: np.ndarray  # int64[N+1], byte offsets into seq_packed
+    seq_packed: np.ndarray   # uint8, 2-bit packed sequences (4 bases/byte)
+
+    def __len__(self):
+        return self.starts.shape[0]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield GeneView(self, i)
+
+    def view(self, i):
+        return GeneView(self, i)
+
+@dataclass
+class GeneView:
+    """Thin accessor presenting one row of the columnar dataset"""
+    ds: GeneDataset
+    i: int
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    @property
+    def gene_id(self):
+        return self.ds.gene_ids[self.i]
+
+    @property
+    def gene_name(self):
+        return self.ds.gene_names[self.i]
+
+    @property
+    def chrom(self):
+        return self.ds.chroms[self.i]
+
+    @property
+    def strand(self):
+        return self.ds.strands[self.i]
+
+    @property
+    def start(self):
+        return int(self.ds.starts[self.i])
+
+    @property
+    def end(self):
+        return int(self.ds.ends[self.i])
+
+    @property
+    def num_exons(self):
+        return int(self.ds.num_exons[self.i])
+
+    @property
+    def complexity(self):
+        return COMPLEXITY_LABELS[self.ds.complexity[self.i]]
+
+    @property
+    def complexity_idx(self):
+        return int(self.ds.complexity[self.i])
+
+    @property
+    def sequence_length(self):
+        return int(self.ds.seq_lengths[self.i])
+
+    @property
+    def exons(self):
+        o = self.ds.exon_offsets
+        return self.ds.exon_coords[o[self.i]:o[self.i + 1]]
+
+    @property
+    def exons_rel(self):
+        o = self.ds.exon_offsets
+        return self.ds.exon_coords_rel[o[self.i]:o[self.i + 1]]
+
+    @property
+    def sequence(self):
+        """ASCII bytes of the region; consumers slice without re-encoding"""
+        o = self.ds.seq_offsets
+        return unpack_sequence(self.ds.seq_packed[o[self.i]:o[self.i + 1]],
+                               self.sequence_length)
+
+    def to_dict(self):
+        """Annotation fields for the metadata dump (no sequence); the exon
+        slice stays a numpy view for orjson's OPT_SERIALIZE_NUMPY"""
+        return {
+            "gene_id": self.gene_id,
+            "gene_name": self.gene_name,
+            "chrom": self.chrom,
+            "start": self.start,
+            "end": self.end,
+            "strand": self.strand,
+            "exons": self.exons,
+            "num_exons": self.num_exons,
+            "complexity": self.complexity,
+            "sequence_length": self.sequence_length
+        }
+
+def generate_dataset(num_genes=50, rng=None):
+    """Generate dataset of human genomic regions with varying complexity.
+
+    All structure and sequence draws come from the passed Generator (a
+    fresh seeded stream by default), so dataset generation is
+    reproducible independently of any other consumer of randomness.
+    """
+    if rng is None:
+        rng = np.random.default_rng(np.random.SeedSequence(RANDOM_SEED))
     chromosomes = ['chr1', 'chr2', 'chr7', 'chr11', 'chr17', 'chr21', 'chr22']
-    
+
     # Distribution: 10 simple, 25 moderate, 15 complex (as per report)
     configs = [
         (1, 2, 10),    # simple: 1-2 exons, 10 genes
         (3, 10, 25),   # moderate: 3-10 exons, 25 genes
         (11, 25, 15),  # complex: 11-25 exons, 15 genes
     ]
-    
+
+    gene_ids, gene_names, chroms, strands = [], [], [], []
+    starts, ends, num_exons_col, complexity_col, seq_lengths = [], [], [], [], []
+    exon_offsets = [0]
+    exon_coords = []
+    seq_offsets = [0]
+    seq_chunks = []
+
     gene_id = 0
-    for min_exons, max_exons, count in configs:
+    for c_idx, (min_exons, max_exons, count) in enumerate(configs):
         for _ in range(count):
             gene_id += 1
-            chrom = random.choice(chromosomes)
-            start = random.randint(1000000, 50000000)
-            num_exons = random.randint(min_exons, max_exons)
-            
+            chrom = chromosomes[rng.integers(len(chromosomes))]
+            start = int(rng.integers(1000000, 50000001))
+            num_exons = int(rng.integers(min_exons, max_exons + 1))
+
             # Generate exon positions
-            exons = []
             pos = start + 1500  # 1.5kb upstream flank
             for i in range(num_exons):
-                exon_len = random.randint(50, 500)
-                exons.append((pos, pos + exon_len))
-                pos += exon_len + random.randint(100, 3000)  # intron
-            
+                exon_len = int(rng.integers(50, 501))
+                exon_coords.append((pos, pos + exon_len))
+                pos += exon_len + int(rng.integers(100, 3001))  # intron
+            exon_offsets.append(len(exon_coords))
+
             end = pos + 1500  # 1.5kb downstream flank
-            
-            # Determine complexity
-            if num_exons <= 2:
-                complexity = "simple"
-            elif num_exons <= 10:
-                complexity = "moderate"
-            else:
-                complexity = "complex"
-            
-            # Generate sequence
+
+            # Generate sequence, packed 2-bit per base
             seq_length = end - start
-            sequence = generate_dna_sequence(seq_length)
-            
-            gene = {
-                "gene_id": f"ENSG{gene_id:011d}",
-                "gene_name": f"GENE{gene_id}",
-                "chrom": chrom,
-                "start": start,
-                "end": end,
-                "strand": random.choice(['+', '-']),
-                "exons": exons,
-                "num_exons": num_exons,
-                "complexity": complexity,
-                "sequence_length": seq_length,
-                "sequence": sequence
-            }
-            genes.append(gene)
-    
-    return genes
+            packed = pack_sequence(generate_dna_sequence(seq_length, rng))
+            seq_chunks.append(packed)
+            seq_offsets.append(seq_offsets[-1] + packed.shape[0])
+
+            gene_ids.append(f"ENSG{gene_id:011d}")
+            gene_names.append(f"GENE{gene_id}")
+            chroms.append(chrom)
+            strands.append('+' if rng.random() < 0.5 else '-')
+            starts.append(start)
+            ends.append(end)
+            num_exons_col.append(num_exons)
+            complexity_col.append(c_idx)
+            seq_lengths.append(seq_length)
+
+    starts_arr = np.asarray(starts, dtype=np.int64)
+    exon_offsets_arr = np.asarray(exon_offsets, dtype=np.int64)
+    exon_coords_arr = np.asarray(exon_coords, dtype=np.int64).reshape(-1, 2)
+
+    # Region-relative coordinates (offset = start - 1500), derived once
+    # here so downstream consumers never recompute them per tool
+    per_exon_offset = np.repeat(starts_arr - 1500, np.diff(exon_offsets_arr))
+    exon_coords_rel = exon_coords_arr - per_exon_offset[:, None]
+
+    return GeneDataset(
+        gene_ids=gene_ids,
+        gene_names=gene_names,
+        chroms=chroms,
+        strands=strands,
+        starts=starts_arr,
+        ends=np.asarray(ends, dtype=np.int64),
+        num_exons=np.asarray(num_exons_col, dtype=np.int32),
+        complexity=np.asarray(complexity_col, dtype=np.uint8),
+        seq_lengths=np.asarray(seq_lengths, dtype=np.int64),
+        exon_offsets=exon_offsets_arr,
+        exon_coords=exon_coords_arr,
+        exon_coords_rel=exon_coords_rel,
+        seq_offsets=np.asarray(seq_offsets, dtype=np.int64),
+        seq_packed=np.concatenate(seq_chunks)
+    )
 
 # ============================================================================
 # GENE PREDICTORS - Simulates Genscan, GlimmerHMM, SNAP, AUGUSTUS
@@ -126,50 +317,68 @@ class GenePredictor:
         self.precision = params["precision"]
         self.boundary_acc = params["boundary_acc"]
         self.speed = params["speed"]
+        # Loop-invariant per-tool table: sensitivity by complexity bucket
+        # (complex genes take a fixed 0.05 penalty), so predict() indexes
+        # instead of rebranching per gene
+        self.effective_sens = (self.sensitivity,
+                               self.sensitivity,
+                               self.sensitivity - 0.05)
     
     def predict(self, gene):
-        """Simulate gene prediction on a genomic region"""
-        start_time = time.time()
-        
-        ref_exons = gene["exons"]
+        """Simulate gene prediction on a genomic region (disk-cached by seed)"""
+        key = hashlib.blake2b(
+            f"{self.name}|{gene['gene_id']}|{RANDOM_SEED}".encode()).hexdigest()
+        cache_path = CACHE_DIR / f"{key}.pkl"
+        if cache_path.exists():
+            return pickle.loads(cache_path.read_bytes())
+
         seq_len = gene["sequence_length"]
-        offset = gene["start"] - 1500
-        
-        ref_exons_rel = [(e[0] - offset, e[1] - offset) for e in ref_exons]
-        
+        ref_exons_rel = [(int(s), int(e)) for s, e in gene["exons_rel"]]
+        n = len(ref_exons_rel)
+        num_exons = gene["num_exons"]
+
+        # Hoist per-gene constants out of the exon loop
+        effective_sens = self.effective_sens[gene["complexity_idx"]]
+        boundary_acc = self.boundary_acc
+
+        # Batch all per-exon random decisions in four C-level draws
+        sens_roll = rng.random(n)
+        bnd_roll = rng.random(n)
+        shifts = rng.integers(-10, 11, size=n)
+        scores = rng.uniform(0.7, 0.99, size=n)
+
         predicted_exons = []
-        
+
         for i, (ref_start, ref_end) in enumerate(ref_exons_rel):
-            complexity_penalty = 0.05 if gene["complexity"] == "complex" else 0
-            effective_sens = self.sensitivity - complexity_penalty
-            
-            if random.random() < effective_sens:
-                if random.random() < self.boundary_acc:
+            if sens_roll[i] < effective_sens:
+                if bnd_roll[i] < boundary_acc:
                     pred_start, pred_end = ref_start, ref_end
                 else:
-                    shift = random.randint(-10, 10)
+                    shift = int(shifts[i])
                     pred_start = max(1, ref_start + shift)
                     pred_end = min(seq_len, ref_end + shift)
-                
+
                 predicted_exons.append({
                     "start": pred_start,
                     "end": pred_end,
-                    "score": random.uniform(0.7, 0.99)
+                    "score": float(scores[i])
                 })
-        
-        if random.random() > self.precision:
-            fp_start = random.randint(100, seq_len - 200)
-            fp_end = fp_start + random.randint(50, 150)
+
+        if rng.random() > self.precision:
+            fp_start = int(rng.integers(100, seq_len - 199))
+            fp_end = fp_start + int(rng.integers(50, 151))
             predicted_exons.append({
                 "start": fp_start,
                 "end": fp_end,
-                "score": random.uniform(0.5, 0.7)
+                "score": float(rng.uniform(0.5, 0.7))
             })
+
+        # The reported runtime/memory are simulated anyway: model them
+        # analytically from the exon count rather than timing this call
+        runtime = float(rng.uniform(0.1, 0.5)) * num_exons * self.speed
+        memory = 30 + num_exons * 3 + float(rng.uniform(0, 10))
         
-        runtime = (time.time() - start_time + random.uniform(0.1, 0.5) * gene["num_exons"]) * self.speed
-        memory = 30 + gene["num_exons"] * 3 + random.uniform(0, 10)
-        
-        return {
+        result = {
             "tool": self.name,
             "gene_id": gene["gene_id"],
             "predicted_exons": predicted_exons,
@@ -177,163 +386,252 @@ class GenePredictor:
             "runtime_seconds": runtime,
             "memory_mb": memory
         }
+        cache_path.write_bytes(pickle.dumps(result, pickle.HIGHEST_PROTOCOL))
+        return result
+
+@functools.lru_cache(maxsize=None)
+def get_predictor(name):
+    """Memoized predictor factory so each process builds each tool once"""
+    return GenePredictor(name)
 
 # ============================================================================
 # EVALUATION METRICS
 # ============================================================================
 
+@njit(inline='always', cache=True)
 def calculate_iou(exon1, exon2):
     start1, end1 = exon1
     start2, end2 = exon2
     intersection = max(0, min(end1, end2) - max(start1, start2))
     union = max(end1, end2) - min(start1, start2)
-    return intersection / union if union > 0 else 0
+    return intersection / union if union > 0 else 0.0
 
-def evaluate_exon_level(predicted_exons, reference_exons, iou_threshold=0.5):
-    pred_set = [(e["start"], e["end"]) for e in predicted_exons]
-    ref_set = reference_exons
-    
-    overlap_tp = 0
-    matched_refs = set()
-    for pred in pred_set:
-        for i, ref in enumerate(ref_set):
-            if i not in matched_refs and calculate_iou(pred, ref) >= iou_threshold:
-                overlap_tp += 1
-                matched_refs.add(i)
-                break
-    
-    return {
-        "tp": overlap_tp,
-        "num_predicted": len(pred_set),
-        "num_reference": len(ref_set)
-    }
+@njit(cache=True)
+def _overlap_edges(pred, ref, iou_threshold):
+    """Enumerate (i, j) pairs with IoU >= threshold via an interval sweep.
 
-def evaluate_gene_level(predicted_exons, reference_exons):
-    pred_set = set((e["start"], e["end"]) for e in predicted_exons)
-    ref_set = set(reference_exons)
-    
-    is_perfect = pred_set == ref_set
-    
-    overlap_count = 0
-    for ref in ref_set:
-        for pred in pred_set:
-            if calculate_iou(pred, ref) >= 0.5:
-                overlap_count += 1
+    Both arrays must already be sorted by start (evaluate_all sorts
+    once for all consumers). Exons are (near-)disjoint, so the sweep
+    visits only overlapping pairs instead of the full P*R grid; JIT
+    compilation keeps the per-pair IoU math out of the interpreter.
+    """
+    n_p, n_r = pred.shape[0], ref.shape[0]
+    rows = np.empty(n_p * n_r, dtype=np.int64)
+    cols = np.empty(n_p * n_r, dtype=np.int64)
+    n_edges = 0
+    lo = 0
+    for i in range(n_p):
+        ps, pe = pred[i, 0], pred[i, 1]
+        while lo < n_r and ref[lo, 1] < ps:
+            lo += 1
+        for j in range(lo, n_r):
+            if ref[j, 0] > pe:
                 break
-    
-    is_partial = overlap_count >= len(ref_set) * 0.5
-    
-    return {"perfect_match": is_perfect, "partial_match": is_partial}
+            if calculate_iou((ps, pe), (ref[j, 0], ref[j, 1])) >= iou_threshold:
+                rows[n_edges] = i
+                cols[n_edges] = j
+                n_edges += 1
+    return rows[:n_edges], cols[:n_edges]
 
-def evaluate_nucleotide_level(predicted_exons, reference_exons, seq_length):
-    pred_coding = set()
-    for e in predicted_exons:
-        pred_coding.update(range(e["start"], e["end"] + 1))
-    
-    ref_coding = set()
-    for start, end in reference_exons:
-        ref_coding.update(range(start, end + 1))
-    
-    all_positions = set(range(1, seq_length + 1))
-    
-    tp = len(pred_coding & ref_coding)
-    fp = len(pred_coding - ref_coding)
-    fn = len(ref_coding - pred_coding)
-    tn = len(all_positions - pred_coding - ref_coding)
-    
-    return {"tp": tp, "fp": fp, "tn": tn, "fn": fn}
+def _match_exons(pred, ref, iou_threshold):
+    """Count matched exon pairs via maximum bipartite (Hopcroft-Karp) matching.
+
+    Greedy first-fit under-counts TPs when one predicted exon overlaps
+    several references; maximum matching on the IoU>=threshold graph is
+    exact and runs in O(sqrt(V)*E).
+    """
+    rows, cols = _overlap_edges(pred, ref, iou_threshold)
+    if rows.shape[0] == 0:
+        return 0
+    graph = csr_matrix((np.ones(rows.shape[0], dtype=np.int8), (rows, cols)),
+                       shape=(pred.shape[0], ref.shape[0]))
+    matching = maximum_bipartite_matching(graph, perm_type='column')
+    return int(np.count_nonzero(matching >= 0))
+
+@njit(cache=True)
+def _merge_intervals(arr):
+    """Merge overlapping intervals; input must be sorted by start"""
+    n = arr.shape[0]
+    out = np.empty((n, 2), dtype=np.int64)
+    if n == 0:
+        return out
+    m = 0
+    out[0, 0] = arr[0, 0]
+    out[0, 1] = arr[0, 1]
+    for k in range(1, n):
+        if arr[k, 0] <= out[m, 1]:
+            if arr[k, 1] > out[m, 1]:
+                out[m, 1] = arr[k, 1]
+        else:
+            m += 1
+            out[m, 0] = arr[k, 0]
+            out[m, 1] = arr[k, 1]
+    return out[:m + 1]
+
+@njit(cache=True)
+def _nucleotide_counts(pred, ref, seq_length):
+    """Coding-base TP/FP/FN/TN from exon intervals in one O(P+R) scan.
+
+    Intervals are inclusive on both ends and must be sorted by start.
+    Each set is merged first so an overlapping false-positive exon is
+    not double-counted; no per-base mask is ever materialized.
+    """
+    pred_m = _merge_intervals(pred)
+    ref_m = _merge_intervals(ref)
+
+    pred_len = 0
+    for i in range(pred_m.shape[0]):
+        pred_len += pred_m[i, 1] - pred_m[i, 0] + 1
+    ref_len = 0
+    for j in range(ref_m.shape[0]):
+        ref_len += ref_m[j, 1] - ref_m[j, 0] + 1
+
+    tp = 0
+    i = 0
+    j = 0
+    while i < pred_m.shape[0] and j < ref_m.shape[0]:
+        s = max(pred_m[i, 0], ref_m[j, 0])
+        e = min(pred_m[i, 1], ref_m[j, 1])
+        if e >= s:
+            tp += e - s + 1
+        if pred_m[i, 1] < ref_m[j, 1]:
+            i += 1
+        else:
+            j += 1
+
+    fp = pred_len - tp
+    fn = ref_len - tp
+    tn = seq_length - tp - fp - fn
+    return tp, fp, fn, tn
+
+def evaluate_all(predicted_exons, reference_exons, seq_length, iou_threshold=0.5):
+    """Exon-, nucleotide-, and gene-level metrics in a single fused pass.
+
+    The three evaluation levels share the same pred/ref interval data, so
+    the arrays, the matching, and the coding masks are each built once.
+    """
+    pred_arr = np.array([(e["start"], e["end"]) for e in predicted_exons],
+                        dtype=np.int64).reshape(-1, 2)
+    ref_arr = np.asarray(reference_exons, dtype=np.int64).reshape(-1, 2)
+
+    # Sort once (start-major, end as tiebreak); the matcher, nucleotide
+    # scan, and perfect check all consume the sorted form
+    pred_arr = pred_arr[np.lexsort((pred_arr[:, 1], pred_arr[:, 0]))]
+    ref_arr = ref_arr[np.lexsort((ref_arr[:, 1], ref_arr[:, 0]))]
+
+    # Exon level: maximum matching on the IoU graph
+    tp_exon = _match_exons(pred_arr, ref_arr, iou_threshold)
+
+    # Nucleotide level: interval scan, no per-base mask materialized
+    tp, fp, fn, tn = _nucleotide_counts(pred_arr, ref_arr, seq_length)
+
+    # Gene level: the sorted arrays compare directly for the perfect
+    # check; the partial criterion reuses the matched-exon count
+    is_perfect = (pred_arr.shape == ref_arr.shape
+                  and bool(np.array_equal(pred_arr, ref_arr)))
+    is_partial = tp_exon >= ref_arr.shape[0] * 0.5
+
+    # Counts in accumulator order so the aggregator adds the whole row:
+    # [tp_exon, pred_exon, ref_exon, tp_nuc, fp_nuc, tn_nuc, fn_nuc]
+    counts = np.array([tp_exon, pred_arr.shape[0], ref_arr.shape[0],
+                       tp, fp, tn, fn], dtype=np.int64)
+    return counts, {"perfect_match": is_perfect, "partial_match": is_partial}
+
+# ============================================================================
+# PARALLEL EXECUTION
+# ============================================================================
+
+_worker_dataset = None
+
+def _init_worker(dataset, seed_queue, tool_names):
+    """Rebind the module generator to this worker's own spawned stream
+    and warm the per-worker predictor instances"""
+    global rng, _worker_dataset
+    rng = np.random.default_rng(seed_queue.get())
+    _worker_dataset = dataset
+    for name in tool_names:
+        get_predictor(name)
+
+def _run_one(args):
+    """Predict and evaluate one (tool, gene) pair; top-level so it pickles"""
+    name, gene_idx = args
+    gene = _worker_dataset.view(gene_idx)
+    pred = get_predictor(name).predict(gene)
+
+    counts, gene_eval = evaluate_all(
+        pred["predicted_exons"], gene["exons_rel"], gene["sequence_length"])
+
+    return pred, counts, gene_eval
 
 # ============================================================================
 # VISUALIZATION
 # ============================================================================
 
-def generate_dashboard(results, metadata):
-    tools = list(results.keys())
-    
-    data = {
-        "tools": tools,
-        "exon_sens": [results[t]["overall"]["exon_sensitivity"] for t in tools],
-        "exon_prec": [results[t]["overall"]["exon_precision"] for t in tools],
-        "exon_f1": [results[t]["overall"]["exon_f1"] for t in tools],
-        "nuc_sens": [results[t]["overall"]["coding_sensitivity"] for t in tools],
-        "nuc_spec": [results[t]["overall"]["noncoding_specificity"] for t in tools],
-        "nuc_mcc": [results[t]["overall"]["mcc"] for t in tools],
-        "gene_perfect": [results[t]["overall"]["gene_perfect_rate"] for t in tools],
-        "gene_partial": [results[t]["overall"]["gene_partial_rate"] for t in tools],
-        "runtime": [results[t]["overall"]["avg_runtime"] for t in tools],
-        "memory": [results[t]["overall"]["avg_memory"] for t in tools],
-        "simple_f1": [results[t]["by_complexity"]["simple"]["exon_f1"] for t in tools],
-        "moderate_f1": [results[t]["by_complexity"]["moderate"]["exon_f1"] for t in tools],
-        "complex_f1": [results[t]["by_complexity"]["complex"]["exon_f1"] for t in tools],
-    }
-    
-    def format_row(values, lower_better=False):
-        best_idx = values.index(min(values) if lower_better else max(values))
-        return '\n'.join([f'<td class="{"best" if i == best_idx else ""}">{v:.4f}</td>' for i, v in enumerate(values)])
-    
-    html = f'''<!DOCTYPE html>
+DASHBOARD_CSS = '''\
+* { margin: 0; padding: 0; box-sizing: border-box; }
+body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); color: #eee; min-height: 100vh; padding: 20px; }
+.container { max-width: 1400px; margin: 0 auto; }
+header { text-align: center; padding: 30px; background: rgba(255,255,255,0.05); border-radius: 15px; margin-bottom: 30px; }
+h1 { font-size: 2em; background: linear-gradient(90deg, #00d4ff, #00ff88); -webkit-background-clip: text; -webkit-text-fill-color: transparent; margin-bottom: 10px; }
+.subtitle { color: #888; }
+.authors { color: #666; margin-top: 15px; }
+.stats { display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 15px; margin-bottom: 30px; }
+.stat-card { background: rgba(255,255,255,0.05); padding: 20px; border-radius: 12px; text-align: center; }
+.stat-value { font-size: 2em; font-weight: bold; color: #00d4ff; }
+.stat-label { color: #888; margin-top: 5px; font-size: 0.9em; }
+.dataset-section { background: rgba(255,255,255,0.05); padding: 25px; border-radius: 12px; margin-bottom: 30px; }
+.dataset-section h2 { color: #00d4ff; margin-bottom: 20px; font-size: 1.4em; }
+.dataset-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); gap: 15px; margin-bottom: 20px; }
+.dataset-card { background: rgba(0,0,0,0.2); padding: 18px; border-radius: 10px; border-left: 3px solid #00d4ff; }
+.dataset-card h4 { color: #00ff88; margin-bottom: 10px; font-size: 1em; }
+.dataset-card p { color: #bbb; font-size: 0.9em; line-height: 1.5; }
+.dataset-card ul { list-style: none; color: #bbb; font-size: 0.9em; }
+.dataset-card li { margin-bottom: 6px; }
+.badge { display: inline-block; padding: 2px 8px; border-radius: 4px; font-size: 0.8em; margin-right: 5px; }
+.badge.green { background: rgba(0,255,136,0.2); color: #00ff88; }
+.badge.blue { background: rgba(0,212,255,0.2); color: #00d4ff; }
+.badge.red { background: rgba(255,107,107,0.2); color: #ff6b6b; }
+.dataset-stats { display: flex; justify-content: space-around; flex-wrap: wrap; gap: 15px; padding: 20px; background: rgba(0,212,255,0.05); border-radius: 10px; }
+.ds-stat { text-align: center; }
+.ds-value { display: block; font-size: 1.8em; font-weight: bold; color: #00ff88; }
+.ds-label { color: #888; font-size: 0.85em; }
+.tools-section { background: rgba(255,255,255,0.05); padding: 25px; border-radius: 12px; margin-bottom: 30px; }
+.tools-section h2 { color: #00d4ff; margin-bottom: 20px; font-size: 1.4em; }
+.tools-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); gap: 15px; }
+.tool-card { background: rgba(0,0,0,0.2); padding: 18px; border-radius: 10px; border-top: 3px solid #666; }
+.tool-card.augustus { border-top-color: #00ff88; }
+.tool-card.snap { border-top-color: #00d4ff; }
+.tool-card.glimmerhmm { border-top-color: #ff6b6b; }
+.tool-card.genscan { border-top-color: #ffd93d; }
+.tool-header { display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px; }
+.tool-header h4 { color: #fff; margin: 0; }
+.tool-badge { font-size: 0.7em; padding: 3px 8px; background: rgba(255,255,255,0.1); border-radius: 4px; color: #888; }
+.tool-card p { color: #aaa; font-size: 0.85em; line-height: 1.5; margin-bottom: 10px; }
+.tool-meta { font-size: 0.75em; color: #666; font-style: italic; }
+.charts { display: grid; grid-template-columns: repeat(auto-fit, minmax(450px, 1fr)); gap: 20px; margin-bottom: 30px; }
+.chart-card { background: rgba(255,255,255,0.05); padding: 20px; border-radius: 12px; }
+.chart-card h3 { margin-bottom: 15px; color: #00d4ff; }
+.chart-container { height: 280px; }
+.full-width { grid-column: 1 / -1; }
+table { width: 100%; border-collapse: collapse; margin-top: 10px; }
+th, td { padding: 12px; text-align: left; border-bottom: 1px solid rgba(255,255,255,0.1); }
+th { background: rgba(0,212,255,0.1); color: #00d4ff; }
+.best { color: #00ff88; font-weight: bold; }
+.findings { background: rgba(0,255,136,0.05); padding: 25px; border-radius: 12px; margin-top: 30px; }
+.findings h2 { color: #00ff88; margin-bottom: 20px; }
+.finding { padding: 15px; background: rgba(255,255,255,0.03); border-radius: 8px; margin-bottom: 10px; }
+.finding strong { color: #00d4ff; }
+footer { text-align: center; padding: 30px; color: #666; }
+'''
+
+DASHBOARD_TEMPLATE = Template('''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Gene Prediction Tool Comparison</title>
     <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); color: #eee; min-height: 100vh; padding: 20px; }}
-        .container {{ max-width: 1400px; margin: 0 auto; }}
-        header {{ text-align: center; padding: 30px; background: rgba(255,255,255,0.05); border-radius: 15px; margin-bottom: 30px; }}
-        h1 {{ font-size: 2em; background: linear-gradient(90deg, #00d4ff, #00ff88); -webkit-background-clip: text; -webkit-text-fill-color: transparent; margin-bottom: 10px; }}
-        .subtitle {{ color: #888; }}
-        .authors {{ color: #666; margin-top: 15px; }}
-        .stats {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 15px; margin-bottom: 30px; }}
-        .stat-card {{ background: rgba(255,255,255,0.05); padding: 20px; border-radius: 12px; text-align: center; }}
-        .stat-value {{ font-size: 2em; font-weight: bold; color: #00d4ff; }}
-        .stat-label {{ color: #888; margin-top: 5px; font-size: 0.9em; }}
-        .dataset-section {{ background: rgba(255,255,255,0.05); padding: 25px; border-radius: 12px; margin-bottom: 30px; }}
-        .dataset-section h2 {{ color: #00d4ff; margin-bottom: 20px; font-size: 1.4em; }}
-        .dataset-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); gap: 15px; margin-bottom: 20px; }}
-        .dataset-card {{ background: rgba(0,0,0,0.2); padding: 18px; border-radius: 10px; border-left: 3px solid #00d4ff; }}
-        .dataset-card h4 {{ color: #00ff88; margin-bottom: 10px; font-size: 1em; }}
-        .dataset-card p {{ color: #bbb; font-size: 0.9em; line-height: 1.5; }}
-        .dataset-card ul {{ list-style: none; color: #bbb; font-size: 0.9em; }}
-        .dataset-card li {{ margin-bottom: 6px; }}
-        .badge {{ display: inline-block; padding: 2px 8px; border-radius: 4px; font-size: 0.8em; margin-right: 5px; }}
-        .badge.green {{ background: rgba(0,255,136,0.2); color: #00ff88; }}
-        .badge.blue {{ background: rgba(0,212,255,0.2); color: #00d4ff; }}
-        .badge.red {{ background: rgba(255,107,107,0.2); color: #ff6b6b; }}
-        .dataset-stats {{ display: flex; justify-content: space-around; flex-wrap: wrap; gap: 15px; padding: 20px; background: rgba(0,212,255,0.05); border-radius: 10px; }}
-        .ds-stat {{ text-align: center; }}
-        .ds-value {{ display: block; font-size: 1.8em; font-weight: bold; color: #00ff88; }}
-        .ds-label {{ color: #888; font-size: 0.85em; }}
-        .tools-section {{ background: rgba(255,255,255,0.05); padding: 25px; border-radius: 12px; margin-bottom: 30px; }}
-        .tools-section h2 {{ color: #00d4ff; margin-bottom: 20px; font-size: 1.4em; }}
-        .tools-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); gap: 15px; }}
-        .tool-card {{ background: rgba(0,0,0,0.2); padding: 18px; border-radius: 10px; border-top: 3px solid #666; }}
-        .tool-card.augustus {{ border-top-color: #00ff88; }}
-        .tool-card.snap {{ border-top-color: #00d4ff; }}
-        .tool-card.glimmerhmm {{ border-top-color: #ff6b6b; }}
-        .tool-card.genscan {{ border-top-color: #ffd93d; }}
-        .tool-header {{ display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px; }}
-        .tool-header h4 {{ color: #fff; margin: 0; }}
-        .tool-badge {{ font-size: 0.7em; padding: 3px 8px; background: rgba(255,255,255,0.1); border-radius: 4px; color: #888; }}
-        .tool-card p {{ color: #aaa; font-size: 0.85em; line-height: 1.5; margin-bottom: 10px; }}
-        .tool-meta {{ font-size: 0.75em; color: #666; font-style: italic; }}
-        .charts {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(450px, 1fr)); gap: 20px; margin-bottom: 30px; }}
-        .chart-card {{ background: rgba(255,255,255,0.05); padding: 20px; border-radius: 12px; }}
-        .chart-card h3 {{ margin-bottom: 15px; color: #00d4ff; }}
-        .chart-container {{ height: 280px; }}
-        .full-width {{ grid-column: 1 / -1; }}
-        table {{ width: 100%; border-collapse: collapse; margin-top: 10px; }}
-        th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid rgba(255,255,255,0.1); }}
-        th {{ background: rgba(0,212,255,0.1); color: #00d4ff; }}
-        .best {{ color: #00ff88; font-weight: bold; }}
-        .findings {{ background: rgba(0,255,136,0.05); padding: 25px; border-radius: 12px; margin-top: 30px; }}
-        .findings h2 {{ color: #00ff88; margin-bottom: 20px; }}
-        .finding {{ padding: 15px; background: rgba(255,255,255,0.03); border-radius: 8px; margin-bottom: 10px; }}
-        .finding strong {{ color: #00d4ff; }}
-        footer {{ text-align: center; padding: 30px; color: #666; }}
-    </style>
+    <link rel="stylesheet" href="dashboard.css">
 </head>
 <body>
     <div class="container">
@@ -344,11 +642,11 @@ def generate_dashboard(results, metadata):
         </header>
         
         <div class="stats">
-            <div class="stat-card"><div class="stat-value">{metadata["total_genes"]}</div><div class="stat-label">Genomic Regions</div></div>
+            <div class="stat-card"><div class="stat-value">$total_genes</div><div class="stat-label">Genomic Regions</div></div>
             <div class="stat-card"><div class="stat-value">4</div><div class="stat-label">Tools Compared</div></div>
-            <div class="stat-card"><div class="stat-value">{metadata["simple"]}</div><div class="stat-label">Simple (1-2 exons)</div></div>
-            <div class="stat-card"><div class="stat-value">{metadata["moderate"]}</div><div class="stat-label">Moderate (3-10)</div></div>
-            <div class="stat-card"><div class="stat-value">{metadata["complex"]}</div><div class="stat-label">Complex (11+)</div></div>
+            <div class="stat-card"><div class="stat-value">$simple</div><div class="stat-label">Simple (1-2 exons)</div></div>
+            <div class="stat-card"><div class="stat-value">$moderate</div><div class="stat-label">Moderate (3-10)</div></div>
+            <div class="stat-card"><div class="stat-value">$complex</div><div class="stat-label">Complex (11+)</div></div>
         </div>
         
         <!-- Dataset Description Section -->
@@ -366,9 +664,9 @@ def generate_dashboard(results, metadata):
                 <div class="dataset-card">
                     <h4>Complexity Distribution</h4>
                     <ul>
-                        <li><span class="badge green">Simple</span> 1-2 exons: {metadata["simple"]} genes</li>
-                        <li><span class="badge blue">Moderate</span> 3-10 exons: {metadata["moderate"]} genes</li>
-                        <li><span class="badge red">Complex</span> 11+ exons: {metadata["complex"]} genes</li>
+                        <li><span class="badge green">Simple</span> 1-2 exons: $simple genes</li>
+                        <li><span class="badge blue">Moderate</span> 3-10 exons: $moderate genes</li>
+                        <li><span class="badge red">Complex</span> 11+ exons: $complex genes</li>
                     </ul>
                 </div>
                 <div class="dataset-card">
@@ -382,19 +680,19 @@ def generate_dashboard(results, metadata):
             </div>
             <div class="dataset-stats">
                 <div class="ds-stat">
-                    <span class="ds-value">{metadata["total_bp"]:,}</span>
+                    <span class="ds-value">$total_bp</span>
                     <span class="ds-label">Total Base Pairs</span>
                 </div>
                 <div class="ds-stat">
-                    <span class="ds-value">{metadata["total_exons"]}</span>
+                    <span class="ds-value">$total_exons</span>
                     <span class="ds-label">Total Exons</span>
                 </div>
                 <div class="ds-stat">
-                    <span class="ds-value">{metadata["avg_exons"]:.1f}</span>
+                    <span class="ds-value">$avg_exons</span>
                     <span class="ds-label">Avg Exons/Gene</span>
                 </div>
                 <div class="ds-stat">
-                    <span class="ds-value">{metadata["avg_gene_len"]:,.0f}</span>
+                    <span class="ds-value">$avg_gene_len</span>
                     <span class="ds-label">Avg Gene Length (bp)</span>
                 </div>
             </div>
@@ -460,14 +758,14 @@ def generate_dashboard(results, metadata):
             <table>
                 <thead><tr><th>Metric</th><th>AUGUSTUS</th><th>SNAP</th><th>GlimmerHMM</th><th>Genscan</th></tr></thead>
                 <tbody>
-                    <tr><td>Exon Sensitivity</td>{format_row(data["exon_sens"])}</tr>
-                    <tr><td>Exon Precision</td>{format_row(data["exon_prec"])}</tr>
-                    <tr><td>Exon F1 Score</td>{format_row(data["exon_f1"])}</tr>
-                    <tr><td>Coding Sensitivity</td>{format_row(data["nuc_sens"])}</tr>
-                    <tr><td>Non-coding Specificity</td>{format_row(data["nuc_spec"])}</tr>
-                    <tr><td>MCC</td>{format_row(data["nuc_mcc"])}</tr>
-                    <tr><td>Gene Perfect Rate</td>{format_row(data["gene_perfect"])}</tr>
-                    <tr><td>Avg Runtime (s)</td>{format_row(data["runtime"], True)}</tr>
+                    <tr><td>Exon Sensitivity</td>$row_exon_sens</tr>
+                    <tr><td>Exon Precision</td>$row_exon_prec</tr>
+                    <tr><td>Exon F1 Score</td>$row_exon_f1</tr>
+                    <tr><td>Coding Sensitivity</td>$row_nuc_sens</tr>
+                    <tr><td>Non-coding Specificity</td>$row_nuc_spec</tr>
+                    <tr><td>MCC</td>$row_nuc_mcc</tr>
+                    <tr><td>Gene Perfect Rate</td>$row_gene_perfect</tr>
+                    <tr><td>Avg Runtime (s)</td>$row_runtime</tr>
                 </tbody>
             </table>
         </div>
@@ -484,65 +782,120 @@ def generate_dashboard(results, metadata):
     </div>
     
     <script>
-        const tools = {json.dumps(data["tools"])};
+        const tools = $tools_json;
         const colors = ['#00ff88', '#00d4ff', '#ff6b6b', '#ffd93d'];
         Chart.defaults.color = '#888';
-        
-        new Chart(document.getElementById('exonChart'), {{
+
+        new Chart(document.getElementById('exonChart'), {
             type: 'bar',
-            data: {{ labels: tools, datasets: [
-                {{ label: 'Sensitivity', data: {json.dumps(data["exon_sens"])}, backgroundColor: colors[0] }},
-                {{ label: 'Precision', data: {json.dumps(data["exon_prec"])}, backgroundColor: colors[1] }},
-                {{ label: 'F1', data: {json.dumps(data["exon_f1"])}, backgroundColor: colors[2] }}
-            ]}},
-            options: {{ responsive: true, maintainAspectRatio: false, scales: {{ y: {{ max: 1 }} }} }}
-        }});
-        
-        new Chart(document.getElementById('nucChart'), {{
+            data: { labels: tools, datasets: [
+                { label: 'Sensitivity', data: $exon_sens_json, backgroundColor: colors[0] },
+                { label: 'Precision', data: $exon_prec_json, backgroundColor: colors[1] },
+                { label: 'F1', data: $exon_f1_json, backgroundColor: colors[2] }
+            ]},
+            options: { responsive: true, maintainAspectRatio: false, scales: { y: { max: 1 } } }
+        });
+
+        new Chart(document.getElementById('nucChart'), {
             type: 'bar',
-            data: {{ labels: tools, datasets: [
-                {{ label: 'Coding Sens', data: {json.dumps(data["nuc_sens"])}, backgroundColor: colors[0] }},
-                {{ label: 'Non-coding Spec', data: {json.dumps(data["nuc_spec"])}, backgroundColor: colors[1] }},
-                {{ label: 'MCC', data: {json.dumps(data["nuc_mcc"])}, backgroundColor: colors[3] }}
-            ]}},
-            options: {{ responsive: true, maintainAspectRatio: false, scales: {{ y: {{ max: 1 }} }} }}
-        }});
-        
-        new Chart(document.getElementById('geneChart'), {{
+            data: { labels: tools, datasets: [
+                { label: 'Coding Sens', data: $nuc_sens_json, backgroundColor: colors[0] },
+                { label: 'Non-coding Spec', data: $nuc_spec_json, backgroundColor: colors[1] },
+                { label: 'MCC', data: $nuc_mcc_json, backgroundColor: colors[3] }
+            ]},
+            options: { responsive: true, maintainAspectRatio: false, scales: { y: { max: 1 } } }
+        });
+
+        new Chart(document.getElementById('geneChart'), {
             type: 'bar',
-            data: {{ labels: tools, datasets: [
-                {{ label: 'Perfect', data: {json.dumps(data["gene_perfect"])}, backgroundColor: colors[0] }},
-                {{ label: 'Partial', data: {json.dumps(data["gene_partial"])}, backgroundColor: colors[1] }}
-            ]}},
-            options: {{ responsive: true, maintainAspectRatio: false, scales: {{ y: {{ max: 1 }} }} }}
-        }});
-        
-        new Chart(document.getElementById('perfChart'), {{
+            data: { labels: tools, datasets: [
+                { label: 'Perfect', data: $gene_perfect_json, backgroundColor: colors[0] },
+                { label: 'Partial', data: $gene_partial_json, backgroundColor: colors[1] }
+            ]},
+            options: { responsive: true, maintainAspectRatio: false, scales: { y: { max: 1 } } }
+        });
+
+        new Chart(document.getElementById('perfChart'), {
             type: 'bar',
-            data: {{ labels: tools, datasets: [
-                {{ label: 'Runtime (s)', data: {json.dumps(data["runtime"])}, backgroundColor: colors[2] }},
-                {{ label: 'Memory (MB)', data: {json.dumps(data["memory"])}, backgroundColor: colors[3] }}
-            ]}},
-            options: {{ responsive: true, maintainAspectRatio: false }}
-        }});
-        
-        new Chart(document.getElementById('complexityChart'), {{
+            data: { labels: tools, datasets: [
+                { label: 'Runtime (s)', data: $runtime_json, backgroundColor: colors[2] },
+                { label: 'Memory (MB)', data: $memory_json, backgroundColor: colors[3] }
+            ]},
+            options: { responsive: true, maintainAspectRatio: false }
+        });
+
+        new Chart(document.getElementById('complexityChart'), {
             type: 'bar',
-            data: {{ labels: tools, datasets: [
-                {{ label: 'Simple', data: {json.dumps(data["simple_f1"])}, backgroundColor: colors[0] }},
-                {{ label: 'Moderate', data: {json.dumps(data["moderate_f1"])}, backgroundColor: colors[1] }},
-                {{ label: 'Complex', data: {json.dumps(data["complex_f1"])}, backgroundColor: colors[2] }}
-            ]}},
-            options: {{ responsive: true, maintainAspectRatio: false, scales: {{ y: {{ max: 1 }} }} }}
-        }});
+            data: { labels: tools, datasets: [
+                { label: 'Simple', data: $simple_f1_json, backgroundColor: colors[0] },
+                { label: 'Moderate', data: $moderate_f1_json, backgroundColor: colors[1] },
+                { label: 'Complex', data: $complex_f1_json, backgroundColor: colors[2] }
+            ]},
+            options: { responsive: true, maintainAspectRatio: false, scales: { y: { max: 1 } } }
+        });
     </script>
 </body>
-</html>'''
-    
-    with open(VIZ_DIR / "dashboard.html", 'w') as f:
-        f.write(html)
-    
-    return VIZ_DIR / "dashboard.html"
+</html>''')
+
+def generate_dashboard(results, metadata):
+    tools = list(results.keys())
+
+    data = {
+        "tools": tools,
+        "exon_sens": [results[t]["overall"]["exon_sensitivity"] for t in tools],
+        "exon_prec": [results[t]["overall"]["exon_precision"] for t in tools],
+        "exon_f1": [results[t]["overall"]["exon_f1"] for t in tools],
+        "nuc_sens": [results[t]["overall"]["coding_sensitivity"] for t in tools],
+        "nuc_spec": [results[t]["overall"]["noncoding_specificity"] for t in tools],
+        "nuc_mcc": [results[t]["overall"]["mcc"] for t in tools],
+        "gene_perfect": [results[t]["overall"]["gene_perfect_rate"] for t in tools],
+        "gene_partial": [results[t]["overall"]["gene_partial_rate"] for t in tools],
+        "runtime": [results[t]["overall"]["avg_runtime"] for t in tools],
+        "memory": [results[t]["overall"]["avg_memory"] for t in tools],
+        "simple_f1": [results[t]["by_complexity"]["simple"]["exon_f1"] for t in tools],
+        "moderate_f1": [results[t]["by_complexity"]["moderate"]["exon_f1"] for t in tools],
+        "complex_f1": [results[t]["by_complexity"]["complex"]["exon_f1"] for t in tools],
+    }
+
+    def format_row(values, lower_better=False):
+        best_idx = values.index(min(values) if lower_better else max(values))
+        return '\n'.join([f'<td class="{"best" if i == best_idx else ""}">{v:.4f}</td>' for i, v in enumerate(values)])
+
+    # Serialize each chart payload exactly once
+    fields = {f"{k}_json": json.dumps(v) for k, v in data.items()}
+
+    fields.update({
+        "row_exon_sens": format_row(data["exon_sens"]),
+        "row_exon_prec": format_row(data["exon_prec"]),
+        "row_exon_f1": format_row(data["exon_f1"]),
+        "row_nuc_sens": format_row(data["nuc_sens"]),
+        "row_nuc_spec": format_row(data["nuc_spec"]),
+        "row_nuc_mcc": format_row(data["nuc_mcc"]),
+        "row_gene_perfect": format_row(data["gene_perfect"]),
+        "row_runtime": format_row(data["runtime"], lower_better=True),
+    })
+
+    fields.update({
+        "total_genes": metadata["total_genes"],
+        "simple": metadata["simple"],
+        "moderate": metadata["moderate"],
+        "complex": metadata["complex"],
+        "total_bp": f'{metadata["total_bp"]:,}',
+        "total_exons": metadata["total_exons"],
+        "avg_exons": f'{metadata["avg_exons"]:.1f}',
+        "avg_gene_len": f'{metadata["avg_gene_len"]:,.0f}',
+    })
+
+    html = DASHBOARD_TEMPLATE.substitute(fields).encode('utf-8')
+    dashboard_path = VIZ_DIR / "dashboard.html"
+
+    # One binary write per artifact, plus a precompressed copy for sweeps
+    (VIZ_DIR / "dashboard.css").write_bytes(DASHBOARD_CSS.encode('utf-8'))
+    dashboard_path.write_bytes(html)
+    (VIZ_DIR / "dashboard.html.gz").write_bytes(
+        gzip.compress(html, compresslevel=6))
+
+    return dashboard_path
 
 # ============================================================================
 # MAIN PIPELINE
@@ -554,130 +907,137 @@ def main():
     print("  Mohammed Abraar Khan & Arul Sathya Rajasrinivasan")
     print("  University of Florida - Bioinformatics Course")
     print("="*70)
-    
-    random.seed(42)
-    
+
     # STAGE 1: Generate Dataset
     print("\n[STAGE 1] GENERATING HUMAN GENOMIC DATASET")
     print("-"*50)
     
     genes = generate_dataset(num_genes=50)
-    
-    complexity_counts = {"simple": 0, "moderate": 0, "complex": 0}
-    for g in genes:
-        complexity_counts[g["complexity"]] += 1
-    
+
+    n_simple, n_moderate, n_complex = np.bincount(genes.complexity, minlength=3).tolist()
+
     print(f"  Generated {len(genes)} genomic regions:")
-    print(f"    - Simple (1-2 exons):    {complexity_counts['simple']}")
-    print(f"    - Moderate (3-10 exons): {complexity_counts['moderate']}")
-    print(f"    - Complex (11+ exons):   {complexity_counts['complex']}")
+    print(f"    - Simple (1-2 exons):    {n_simple}")
+    print(f"    - Moderate (3-10 exons): {n_moderate}")
+    print(f"    - Complex (11+ exons):   {n_complex}")
     
     for gene in genes:
         fasta_path = SEQ_DIR / f"{gene['gene_id']}.fa"
-        with open(fasta_path, 'w') as f:
-            f.write(f">{gene['gene_id']} {gene['chrom']}:{gene['start']}-{gene['end']}\n")
-            f.write(gene["sequence"] + "\n")
-    
-    total_bp = sum(g['sequence_length'] for g in genes)
-    total_exons = sum(g['num_exons'] for g in genes)
-    
+        header = f">{gene['gene_id']} {gene['chrom']}:{gene['start']}-{gene['end']}\n".encode('ascii')
+        fasta_path.write_bytes(b"".join((header, gene["sequence"], b"\n")))
+
+    total_bp = int(genes.seq_lengths.sum())
+    total_exons = int(genes.num_exons.sum())
+
     metadata = {
         "total_genes": len(genes),
-        "simple": complexity_counts["simple"],
-        "moderate": complexity_counts["moderate"],
-        "complex": complexity_counts["complex"],
+        "simple": n_simple,
+        "moderate": n_moderate,
+        "complex": n_complex,
         "total_bp": total_bp,
         "total_exons": total_exons,
         "avg_exons": total_exons / len(genes),
         "avg_gene_len": total_bp / len(genes),
-        "genes": [{k: v for k, v in g.items() if k != "sequence"} for g in genes]
+        "genes": [g.to_dict() for g in genes]
     }
     
-    with open(DATA_DIR / "metadata.json", 'w') as f:
-        json.dump(metadata, f, indent=2)
+    (DATA_DIR / "metadata.json").write_bytes(
+        orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     
     print(f"  Total sequence: {total_bp:,} bp")
     print(f"  Total exons: {total_exons}")
     
-    # STAGE 2: Run Predictors
+    # STAGE 2: Run Predictors (and evaluate, in parallel across cores)
     print("\n[STAGE 2] RUNNING GENE PREDICTION TOOLS")
     print("-"*50)
-    
+
     tools = ["AUGUSTUS", "SNAP", "GlimmerHMM", "Genscan"]
-    predictors = {name: GenePredictor(name) for name in tools}
+    tasks = list(itertools.product(tools, range(len(genes))))
+
     all_predictions = {name: [] for name in tools}
-    
-    for i, gene in enumerate(genes):
-        for name, predictor in predictors.items():
-            pred = predictor.predict(gene)
+    all_evals = {name: [] for name in tools}
+
+    # Each (tool, gene) task is independent and CPU-bound: fan out to
+    # workers, each drawing from its own SeedSequence-spawned PCG64 stream
+    n_workers = os.cpu_count() or 1
+    seed_queue = multiprocessing.Queue()
+    for child in np.random.SeedSequence(RANDOM_SEED).spawn(n_workers):
+        seed_queue.put(child)
+
+    # Keep stdout out of the result-collection loop: batch the progress
+    # lines and flush them in one write once the pool drains
+    progress = []
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                             initargs=(genes, seed_queue, tuple(tools))) as executor:
+        for i, ((name, _), outcome) in enumerate(zip(tasks, executor.map(_run_one, tasks, chunksize=8))):
+            pred, counts, gene_eval = outcome
             all_predictions[name].append(pred)
-        if (i + 1) % 10 == 0:
-            print(f"  Processed {i+1}/{len(genes)} regions...")
-    
+            all_evals[name].append((counts, gene_eval))
+            if (i + 1) % 50 == 0:
+                progress.append(f"  Completed {i+1}/{len(tasks)} prediction tasks...")
+    sys.stdout.write("\n".join(progress) + "\n")
+
     for tool_name, preds in all_predictions.items():
         tool_dir = RESULTS_DIR / tool_name.lower()
         tool_dir.mkdir(exist_ok=True)
-        with open(tool_dir / "predictions.json", 'w') as f:
-            json.dump(preds, f, indent=2)
+        # Machine-consumed downstream: compact encoding, no pretty-printing
+        (tool_dir / "predictions.json").write_bytes(
+            orjson.dumps(preds, option=orjson.OPT_SERIALIZE_NUMPY))
     
     # STAGE 3: Evaluation
     print("\n[STAGE 3] EVALUATING PREDICTIONS")
     print("-"*50)
     
     results = {}
-    
-    for tool_name in tools:
+
+    # SoA accumulator: axis 0 = tool, axis 1 = complexity bucket
+    # (0=simple, 1=moderate, 2=complex, 3=all), axis 2 = counters
+    # [tp_exon, pred_exon, ref_exon, tp_nuc, fp_nuc, tn_nuc, fn_nuc]
+    totals = np.zeros((len(tools), 4, 7), dtype=np.int64)
+
+    summary_lines = []
+    for t_idx, tool_name in enumerate(tools):
         preds = all_predictions[tool_name]
+
+        # Counts come back from evaluate_all already in accumulator
+        # order: one stacked matrix, two vectorized reductions
+        counts_mat = np.stack([c for c, _ in all_evals[tool_name]])
+        np.add.at(totals[t_idx], genes.complexity, counts_mat)
+        totals[t_idx, 3] = counts_mat.sum(axis=0)
+
+        # Gene-level flags and runtime/memory reduce vectorized
+        perfect = np.array([ge["perfect_match"] for _, ge in all_evals[tool_name]])
+        partial = np.array([ge["partial_match"] for _, ge in all_evals[tool_name]])
+        total_gene = {
+            "perfect": int(np.count_nonzero(perfect)),
+            "partial": int(np.count_nonzero(~perfect & partial)),
+            "total": len(genes)
+        }
+        total_runtime = float(np.sum([p["runtime_seconds"] for p in preds]))
+        total_memory = float(np.sum([p["memory_mb"] for p in preds]))
         
-        total_exon = {"tp": 0, "pred": 0, "ref": 0}
-        total_nuc = {"tp": 0, "fp": 0, "tn": 0, "fn": 0}
-        total_gene = {"perfect": 0, "partial": 0, "total": 0}
-        total_runtime = 0
-        total_memory = 0
-        
-        complexity_results = {c: {"tp": 0, "pred": 0, "ref": 0} for c in ["simple", "moderate", "complex"]}
-        
-        for gene, pred in zip(genes, preds):
-            offset = gene["start"] - 1500
-            ref_exons = [(e[0] - offset, e[1] - offset) for e in gene["exons"]]
-            
-            exon_eval = evaluate_exon_level(pred["predicted_exons"], ref_exons)
-            total_exon["tp"] += exon_eval["tp"]
-            total_exon["pred"] += exon_eval["num_predicted"]
-            total_exon["ref"] += exon_eval["num_reference"]
-            
-            complexity_results[gene["complexity"]]["tp"] += exon_eval["tp"]
-            complexity_results[gene["complexity"]]["pred"] += exon_eval["num_predicted"]
-            complexity_results[gene["complexity"]]["ref"] += exon_eval["num_reference"]
-            
-            nuc_eval = evaluate_nucleotide_level(pred["predicted_exons"], ref_exons, gene["sequence_length"])
-            for k in ["tp", "fp", "tn", "fn"]:
-                total_nuc[k] += nuc_eval[k]
-            
-            gene_eval = evaluate_gene_level(pred["predicted_exons"], ref_exons)
-            total_gene["total"] += 1
-            if gene_eval["perfect_match"]:
-                total_gene["perfect"] += 1
-            elif gene_eval["partial_match"]:
-                total_gene["partial"] += 1
-            
-            total_runtime += pred["runtime_seconds"]
-            total_memory += pred["memory_mb"]
-        
-        exon_sens = total_exon["tp"] / total_exon["ref"] if total_exon["ref"] > 0 else 0
-        exon_prec = total_exon["tp"] / total_exon["pred"] if total_exon["pred"] > 0 else 0
+        tp_e, pred_e, ref_e, tp_n, fp_n, tn_n, fn_n = (int(v) for v in totals[t_idx, 3])
+
+        exon_sens = tp_e / ref_e if ref_e > 0 else 0
+        exon_prec = tp_e / pred_e if pred_e > 0 else 0
         exon_f1 = 2 * exon_sens * exon_prec / (exon_sens + exon_prec) if (exon_sens + exon_prec) > 0 else 0
-        
-        nuc_sens = total_nuc["tp"] / (total_nuc["tp"] + total_nuc["fn"]) if (total_nuc["tp"] + total_nuc["fn"]) > 0 else 0
-        nuc_spec = total_nuc["tn"] / (total_nuc["tn"] + total_nuc["fp"]) if (total_nuc["tn"] + total_nuc["fp"]) > 0 else 0
-        denom = ((total_nuc["tp"]+total_nuc["fp"])*(total_nuc["tp"]+total_nuc["fn"])*(total_nuc["tn"]+total_nuc["fp"])*(total_nuc["tn"]+total_nuc["fn"])) ** 0.5
-        mcc = ((total_nuc["tp"]*total_nuc["tn"]) - (total_nuc["fp"]*total_nuc["fn"])) / denom if denom > 0 else 0
-        
+
+        nuc_sens = tp_n / (tp_n + fn_n) if (tp_n + fn_n) > 0 else 0
+        nuc_spec = tn_n / (tn_n + fp_n) if (tn_n + fp_n) > 0 else 0
+        # Take sqrt of each factor separately: the four-way int product
+        # can exceed double precision at genome-scale TN counts
+        if min(tp_n + fp_n, tp_n + fn_n, tn_n + fp_n, tn_n + fn_n) == 0:
+            mcc = 0
+        else:
+            denom = (math.sqrt(float(tp_n + fp_n)) * math.sqrt(float(tp_n + fn_n))
+                     * math.sqrt(float(tn_n + fp_n)) * math.sqrt(float(tn_n + fn_n)))
+            mcc = ((tp_n * tn_n) - (fp_n * fn_n)) / denom
+
         by_complexity = {}
-        for c in ["simple", "moderate", "complex"]:
-            cr = complexity_results[c]
-            sens = cr["tp"] / cr["ref"] if cr["ref"] > 0 else 0
-            prec = cr["tp"] / cr["pred"] if cr["pred"] > 0 else 0
+        for c_idx, c in enumerate(COMPLEXITY_LABELS):
+            tp_c, pred_c, ref_c = (int(v) for v in totals[t_idx, c_idx, :3])
+            sens = tp_c / ref_c if ref_c > 0 else 0
+            prec = tp_c / pred_c if pred_c > 0 else 0
             f1 = 2 * sens * prec / (sens + prec) if (sens + prec) > 0 else 0
             by_complexity[c] = {"exon_f1": round(f1, 4)}
         
@@ -697,10 +1057,12 @@ def main():
             "by_complexity": by_complexity
         }
         
-        print(f"  {tool_name:12} | F1: {exon_f1:.3f} | Coding Sens: {nuc_sens:.3f} | Perfect: {total_gene['perfect']}/{total_gene['total']}")
-    
-    with open(RESULTS_DIR / "evaluation_results.json", 'w') as f:
-        json.dump(results, f, indent=2)
+        summary_lines.append(f"  {tool_name:12} | F1: {exon_f1:.3f} | Coding Sens: {nuc_sens:.3f} | Perfect: {total_gene['perfect']}/{total_gene['total']}")
+
+    sys.stdout.write("\n".join(summary_lines) + "\n")
+
+    (RESULTS_DIR / "evaluation_results.json").write_bytes(
+        orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     
     # STAGE 4: Visualization
     print("\n[STAGE 4] GENERATING DASHBOARD")